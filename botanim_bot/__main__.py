@@ -1,22 +1,30 @@
 import logging
+from telegram import Update
 from telegram.ext import (
     ApplicationBuilder,
     CallbackQueryHandler,
     CommandHandler,
+    ContextTypes,
     MessageHandler,
     filters,
 )
 
 from botanim_bot.db import close_db
+from botanim_bot.json_request import FastJSONRequest
 
 from botanim_bot import config
 from botanim_bot import handlers
 
 
+# Root stays at WARNING with a format without asctime: PTB and httpx
+# log INFO per update, and the strftime per record adds up under load.
+# The bot's own loggers keep INFO.
 logging.basicConfig(
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s", level=logging.INFO
+    format="%(levelname)s %(name)s: %(message)s", level=logging.WARNING
 )
+logging.getLogger("botanim_bot").setLevel(logging.INFO)
 logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
 
 
 if not config.TELEGRAM_BOT_TOKEN or not config.TELEGRAM_BOTANIM_CHANNEL_ID:
@@ -24,34 +32,60 @@ if not config.TELEGRAM_BOT_TOKEN or not config.TELEGRAM_BOTANIM_CHANNEL_ID:
                      "wasn't implemented in .env (both should be initialized).")
 
 
+COMMAND_HANDLERS = {
+    "start": handlers.start,
+    "help": handlers.help_,
+    "allbooks": handlers.all_books,
+    "already": handlers.already,
+    "now": handlers.now,
+    "vote": handlers.vote,
+    "cancel": handlers.cancel,
+    "voteresults": handlers.vote_results,
+}
+
+
+async def _dispatch_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    # CommandHandler also matches edited messages, where update.message
+    # is None — effective_message covers both.
+    command = update.effective_message.text.split()[0][1:].split("@")[0].lower()
+    await COMMAND_HANDLERS[command](update, context)
+
+
 def main():
-    application = ApplicationBuilder().token(config.TELEGRAM_BOT_TOKEN).build()
-
-    COMMAND_HANDLERS = {
-        "start": handlers.start,
-        "help": handlers.help_,
-        "allbooks": handlers.all_books,
-        "already": handlers.already,
-        "now": handlers.now,
-        "vote": handlers.vote,
-        "cancel": handlers.cancel,
-        "voteresults": handlers.vote_results,
-    }
-    for command_name, command_handler in COMMAND_HANDLERS.items():
-        application.add_handler(CommandHandler(command_name, command_handler))
+    application = (
+        ApplicationBuilder()
+        .token(config.TELEGRAM_BOT_TOKEN)
+        .concurrent_updates(True)
+        .request(FastJSONRequest(connection_pool_size=256))
+        .get_updates_request(FastJSONRequest())
+        .build()
+    )
+
+    application.add_handler(
+        CommandHandler(list(COMMAND_HANDLERS), _dispatch_command)
+    )
 
     CALLBACK_QUERY_HANDLERS = {
-        rf"^{config.ALL_BOOKS_CALLBACK_PATTERN}(\d+)$": handlers.all_books_button,
-        rf"^{config.VOTE_BOOKS_CALLBACK_PATTERN}(\d+)$": handlers.vote_button,
+        config.ALL_BOOKS_CALLBACK_RE: handlers.all_books_button,
+        config.VOTE_BOOKS_CALLBACK_RE: handlers.vote_button,
     }
     for pattern, handler in CALLBACK_QUERY_HANDLERS.items():
-        application.add_handler(CallbackQueryHandler(handler, pattern=pattern))
+        application.add_handler(CallbackQueryHandler(handler, pattern=pattern), group=1)
 
     application.add_handler(
-        MessageHandler(filters.TEXT & (~filters.COMMAND), handlers.vote_process)
+        MessageHandler(filters.TEXT & (~filters.COMMAND), handlers.vote_process),
+        group=2,
     )
 
-    application.run_polling()
+    if config.WEBHOOK_BASE:
+        application.run_webhook(
+            listen="0.0.0.0",
+            port=config.WEBHOOK_PORT,
+            url_path=config.TELEGRAM_BOT_TOKEN,
+            webhook_url=f"{config.WEBHOOK_BASE}/{config.TELEGRAM_BOT_TOKEN}",
+        )
+    else:
+        application.run_polling()
 
 
 if __name__ == "__main__":
@@ -1,4 +1,5 @@
 import os
+import re
 from pathlib import Path
 
 from dotenv import load_dotenv
@@ -10,8 +11,13 @@ load_dotenv()
 TELEGRAM_BOT_TOKEN = os.getenv("TELEGRAM_BOT_TOKEN", "")
 TELEGRAM_BOTANIM_CHANNEL_ID = int(os.getenv("TELEGRAM_BOTANIM_CHANNEL_ID", "0"))
 
+# Public base URL for the webhook, e.g. https://bot.example.com.
+# When empty, the bot falls back to getUpdates polling (local dev).
+WEBHOOK_BASE = os.getenv("WEBHOOK_BASE", "")
+WEBHOOK_PORT = int(os.getenv("WEBHOOK_PORT", "8443"))
 
-BASE_DIR = Path(__file__).resolve().parent
+
+BASE_DIR = Path(__file__).parent
 SQLITE_DB_FILE = BASE_DIR / "db.sqlite3"
 TEMPLATES_DIR = BASE_DIR / "templates"
 
@@ -22,3 +28,5 @@ VOTE_RESULTS_TOP = 10
 
 ALL_BOOKS_CALLBACK_PATTERN = "all_books_"
 VOTE_BOOKS_CALLBACK_PATTERN = "vote_"
+ALL_BOOKS_CALLBACK_RE = re.compile(rf"^{ALL_BOOKS_CALLBACK_PATTERN}(\d+)$")
+VOTE_BOOKS_CALLBACK_RE = re.compile(rf"^{VOTE_BOOKS_CALLBACK_PATTERN}(\d+)$")
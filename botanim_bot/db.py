@@ -1,5 +1,6 @@
 import asyncio
-from collections.abc import Iterable
+from collections.abc import AsyncIterator, Iterable
+from contextlib import asynccontextmanager
 from typing import Any, LiteralString
 
 import aiosqlite
@@ -7,10 +8,25 @@ import aiosqlite
 from botanim_bot import config
 
 
+# All writes share one connection, so with concurrent updates every
+# commit (and the whole begin..commit span of a transaction) has to be
+# serialized to keep transactions from interleaving.
+_write_lock = asyncio.Lock()
+_connect_lock = asyncio.Lock()
+
+
 async def get_db() -> aiosqlite.Connection:
     if not getattr(get_db, "db", None):
-        db = await aiosqlite.connect(config.SQLITE_DB_FILE)
-        setattr(get_db, "db", db)
+        async with _connect_lock:
+            # Re-check under the lock: with concurrent updates another
+            # task may have connected while this one waited, and a
+            # second connect would leak a connection and its thread.
+            if not getattr(get_db, "db", None):
+                db = await aiosqlite.connect(config.SQLITE_DB_FILE)
+                db.row_factory = aiosqlite.Row
+                await db.execute("PRAGMA journal_mode=WAL")
+                await db.execute("PRAGMA synchronous=NORMAL")
+                setattr(get_db, "db", db)
 
     return getattr(get_db, "db")
 
@@ -20,9 +36,7 @@ async def fetch_all(
 ) -> list[dict]:
     cursor = await _get_cursor(sql, params)
     rows = await cursor.fetchall()
-    results = []
-    for row_ in rows:
-        results.append(_get_result_with_column_names(cursor, row_))
+    results = [_get_result_with_column_names(cursor, row_) for row_ in rows]
     await cursor.close()
     return results
 
@@ -45,11 +59,28 @@ async def execute(
     *,
     autocommit: bool = True
 ) -> None:
-    db = await get_db()
-    args: tuple[LiteralString, Iterable[Any] | None] = (sql, params)
-    await db.execute(*args)
     if autocommit:
-        await db.commit()
+        async with _write_lock:
+            await _execute(sql, params)
+            await (await get_db()).commit()
+        return
+    await _execute(sql, params)
+
+
+@asynccontextmanager
+async def transaction() -> AsyncIterator[None]:
+    """Runs the wrapped statements in one serialized transaction.
+
+    Statements inside the block must use `execute(..., autocommit=False)`
+    so they join the transaction instead of waiting on the write lock."""
+    async with _write_lock:
+        await _execute("begin")
+        try:
+            yield
+        except BaseException:
+            await _execute("rollback")
+            raise
+        await _execute("commit")
 
 
 def close_db() -> None:
@@ -60,19 +91,22 @@ async def _async_close_db() -> None:
     await (await get_db()).close()
 
 
+async def _execute(
+    sql: LiteralString, params: Iterable[Any] | None = None
+) -> None:
+    db = await get_db()
+    args: tuple[LiteralString, Iterable[Any] | None] = (sql, params)
+    await db.execute(*args)
+
+
 async def _get_cursor(
     sql: LiteralString, params: Iterable[Any] | None
 ) -> aiosqlite.Cursor:
     db = await get_db()
     args: tuple[LiteralString, Iterable[Any] | None] = (sql, params)
-    cursor = await db.execute(*args)
-    db.row_factory = aiosqlite.Row
-    return cursor
+    return await db.execute(*args)
 
 
 def _get_result_with_column_names(cursor: aiosqlite.Cursor, row: aiosqlite.Row) -> dict:
-    column_names = [d[0] for d in cursor.description]
-    resulting_row = {}
-    for index, column_name in enumerate(column_names):
-        resulting_row[column_name] = row[index]
-    return resulting_row
+    column_names = (d[0] for d in cursor.description)
+    return dict(zip(column_names, row))
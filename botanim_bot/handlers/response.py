@@ -1,27 +1,48 @@
+import logging
 from typing import cast
 
-import telegram
-from telegram import Chat, InlineKeyboardMarkup, Update
+from telegram import CallbackQuery, Chat, InlineKeyboardMarkup, Update
+from telegram.constants import ParseMode
+from telegram.error import TelegramError
 from telegram.ext import ContextTypes
 
 
+logger = logging.getLogger(__name__)
+
+
 async def send_response(
     update: Update,
     context: ContextTypes.DEFAULT_TYPE,
     response: str,
     keyboard: InlineKeyboardMarkup | None = None,
 ) -> None:
-    args = {
-        "chat_id": _get_chat_id(update),
-        "disable_web_page_preview": True,
-        "text": response,
-        "parse_mode": telegram.constants.ParseMode.HTML,
-    }
-    if keyboard:
-        args["reply_markup"] = keyboard
+    if update.effective_message is not None:
+        # quote=False: in group chats reply_text would otherwise quote
+        # the triggering message, which bot.send_message never did.
+        await update.effective_message.reply_text(
+            response,
+            disable_web_page_preview=True,
+            parse_mode=ParseMode.HTML,
+            reply_markup=keyboard,
+            quote=False,
+        )
+        return
+
+    await context.bot.send_message(
+        chat_id=cast(Chat, update.effective_chat).id,
+        text=response,
+        disable_web_page_preview=True,
+        parse_mode=ParseMode.HTML,
+        reply_markup=keyboard,
+    )
 
-    await context.bot.send_message(**args)
 
+async def answer_callback_query_safely(query: CallbackQuery) -> None:
+    """Acks the callback query, ignoring Telegram errors.
 
-def _get_chat_id(update: Update) -> int:
-    return cast(Chat, update.effective_chat).id
+    The ack is fire-and-forget: a failed answer (e.g. the query already
+    expired) shouldn't prevent the handler from updating the message."""
+    try:
+        await query.answer()
+    except TelegramError:
+        logger.debug("Failed to answer callback query", exc_info=True)
@@ -1,3 +1,4 @@
+import asyncio
 from typing import cast
 
 import telegram
@@ -5,12 +6,12 @@ from telegram import Update, User
 from telegram.ext import ContextTypes
 
 from botanim_bot import config
-from botanim_bot.services.books import (
-    calculate_category_books_start_index,
-    get_not_started_books,
-)
+from botanim_bot.services.books_cache import get_category_pages_by_callback_prefix
 from botanim_bot.handlers.keyboards import get_categories_keyboard
-from botanim_bot.handlers.response import send_response
+from botanim_bot.handlers.response import (
+    answer_callback_query_safely,
+    send_response,
+)
 from botanim_bot.services.validation import is_user_in_channel
 from botanim_bot.services.vote_mode import set_user_in_vote_mode
 from botanim_bot.services.votings import get_actual_voting
@@ -32,7 +33,11 @@ def validate_user(handler):
 
 @validate_user
 async def vote(update: Update, context: ContextTypes.DEFAULT_TYPE):
-    if await get_actual_voting() is None:
+    actual_voting, category_pages = await asyncio.gather(
+        get_actual_voting(),
+        get_category_pages_by_callback_prefix(config.VOTE_BOOKS_CALLBACK_PATTERN),
+    )
+    if actual_voting is None:
         await send_response(
             update, context, response=render_template("vote_no_actual_voting.j2")
         )
@@ -41,21 +46,11 @@ async def vote(update: Update, context: ContextTypes.DEFAULT_TYPE):
     if not update.message:
         return
 
-    categories_with_books = tuple(await get_not_started_books())
-    current_category = categories_with_books[0]
-
-    category_books_start_index = calculate_category_books_start_index(
-        categories_with_books, current_category
-    )
-
     await set_user_in_vote_mode(cast(User, update.effective_user).id)
     await update.message.reply_text(
-        render_template(
-            "category_with_books.j2",
-            {"category": current_category, "start_index": category_books_start_index},
-        ),
+        category_pages[0],
         reply_markup=get_categories_keyboard(
-            0, len(categories_with_books), config.VOTE_BOOKS_CALLBACK_PATTERN
+            0, len(category_pages), config.VOTE_BOOKS_CALLBACK_PATTERN
         ),
         parse_mode=telegram.constants.ParseMode.HTML,
     )
@@ -65,33 +60,28 @@ async def vote(update: Update, context: ContextTypes.DEFAULT_TYPE):
 
 
 @validate_user
-async def vote_button(update: Update, _: ContextTypes.DEFAULT_TYPE):
+async def vote_button(update: Update, context: ContextTypes.DEFAULT_TYPE):
     query = update.callback_query
-    await query.answer()
-    if not query.data or not query.data.strip():
-        return
-    categories_with_books = list(await get_not_started_books())
-
-    current_category_index = _get_current_category_index(query.data)
-    current_category = categories_with_books[current_category_index]
-
-    category_books_start_index = calculate_category_books_start_index(
-        categories_with_books, current_category
+    # Ack before queueing on the semaphore, so rapid clicks don't wait
+    # for earlier edits before being answered.
+    await answer_callback_query_safely(query)
+    semaphore = context.chat_data.setdefault(
+        "paginator_semaphore", asyncio.Semaphore(1)
     )
-    await query.edit_message_text(
-        render_template(
-            "category_with_books.j2",
-            {"category": current_category, "start_index": category_books_start_index},
-        ),
-        reply_markup=get_categories_keyboard(
-            current_category_index,
-            len(categories_with_books),
-            config.VOTE_BOOKS_CALLBACK_PATTERN,
-        ),
-        parse_mode=telegram.constants.ParseMode.HTML,
-    )
-
+    async with semaphore:
+        category_pages = await get_category_pages_by_callback_prefix(
+            config.VOTE_BOOKS_CALLBACK_PATTERN
+        )
+        if not context.matches:
+            return
 
-def _get_current_category_index(query_data) -> int:
-    pattern_prefix_length = len(config.VOTE_BOOKS_CALLBACK_PATTERN)
-    return int(query_data[pattern_prefix_length:])
+        current_category_index = int(context.matches[0].group(1))
+        await query.edit_message_text(
+            category_pages[current_category_index],
+            reply_markup=get_categories_keyboard(
+                current_category_index,
+                len(category_pages),
+                config.VOTE_BOOKS_CALLBACK_PATTERN,
+            ),
+            parse_mode=telegram.constants.ParseMode.HTML,
+        )
@@ -1,3 +1,4 @@
+import asyncio
 import re
 from typing import cast
 from telegram import Update, User
@@ -14,24 +15,42 @@ from botanim_bot.services.votings import save_vote
 from botanim_bot.templates import render_template
 
 
+_DIGITS_RE = re.compile(r"\d+")
+
+# A successful vote always has exactly VOTE_ELEMENTS_COUNT books.
+_VOTE_BOOKS_COUNT_WITH_WORD = (
+    f"{config.VOTE_ELEMENTS_COUNT} {books_to_words(config.VOTE_ELEMENTS_COUNT)}"
+)
+
+
 @validate_user
 async def vote_process(update: Update, context: ContextTypes.DEFAULT_TYPE):
-    if not await is_user_in_vote_mode(cast(User, update.effective_user).id):
+    user_id = cast(User, update.effective_user).id
+    books_positional_numbers = _get_numbers_from_text(update.message.text)
+
+    if not _is_numbers_sufficient(books_positional_numbers):
+        if not await is_user_in_vote_mode(user_id):
+            await send_response(
+                update,
+                context,
+                response=render_template("vote_user_not_in_right_mode.j2"),
+            )
+            return
         await send_response(
-            update, context, response=render_template("vote_user_not_in_right_mode.j2")
+            update, context, response=render_template("vote_incorrect_input.j2")
         )
         return
 
-    user_message = update.message.text
-
-    books_positional_numbers = _get_numbers_from_text(user_message)
-    if not _is_numbers_sufficient(books_positional_numbers):
+    user_in_vote_mode, selected_books = await asyncio.gather(
+        is_user_in_vote_mode(user_id),
+        get_books_by_positional_numbers(books_positional_numbers),
+    )
+    if not user_in_vote_mode:
         await send_response(
-            update, context, response=render_template("vote_incorrect_input.j2")
+            update, context, response=render_template("vote_user_not_in_right_mode.j2")
         )
         return
 
-    selected_books = await get_books_by_positional_numbers(books_positional_numbers)
     if not _is_finded_books_count_sufficient(selected_books):
         await send_response(
             update, context, render_template("vote_incorrect_books.j2")
@@ -39,7 +58,7 @@ async def vote_process(update: Update, context: ContextTypes.DEFAULT_TYPE):
         return
 
     try:
-        await save_vote(cast(User, update.effective_user).id, selected_books)
+        await save_vote(user_id, selected_books)
     except NoActualVoting:
         await send_response(
             update, context, response=render_template("vote_no_actual_voting.j2")
@@ -51,7 +70,6 @@ async def vote_process(update: Update, context: ContextTypes.DEFAULT_TYPE):
         )
         return
 
-    books_count = len(selected_books)
     await send_response(
         update,
         context,
@@ -59,14 +77,14 @@ async def vote_process(update: Update, context: ContextTypes.DEFAULT_TYPE):
             "vote_success.j2",
             {
                 "selected_books": selected_books,
-                "books_count": f"{books_count} {books_to_words(books_count)}",
+                "books_count": _VOTE_BOOKS_COUNT_WITH_WORD,
             },
         ),
     )
 
 
 def _get_numbers_from_text(message: str) -> list[int]:
-    return list(map(int, re.findall(r"\d+", message)))
+    return [int(match.group()) for match in _DIGITS_RE.finditer(message)]
 
 
 def _is_numbers_sufficient(numbers: list[int]) -> bool:
@@ -0,0 +1,25 @@
+from typing import Any
+
+from telegram.error import TelegramError
+from telegram.request import HTTPXRequest
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class FastJSONRequest(HTTPXRequest):
+    """HTTPXRequest that parses Telegram responses with orjson.
+
+    Falls back to the standard library parser when orjson
+    isn't installed."""
+
+    @staticmethod
+    def parse_json_payload(payload: bytes) -> dict[str, Any]:
+        if orjson is None:
+            return HTTPXRequest.parse_json_payload(payload)
+        try:
+            return orjson.loads(payload)
+        except ValueError as exc:
+            raise TelegramError("Invalid server response") from exc
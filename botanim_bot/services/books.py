@@ -61,42 +61,25 @@ class Category:
 
 
 async def get_all_books() -> Iterable[Category]:
-    sql = f"""{_get_books_base_sql()}
-              ORDER BY c."ordering", b."ordering" """
-    books = await _get_books_from_db(sql)
+    books = await _get_books_from_db(_ALL_BOOKS_SQL)
     return _group_books_by_categories(books)
 
 
 async def get_not_started_books() -> Iterable[Category]:
-    sql = f"""{_get_books_base_sql()}
-              WHERE b.read_start IS NULL
-              ORDER BY c."ordering", b."ordering" """
-    books = await _get_books_from_db(sql)
+    books = await _get_books_from_db(_NOT_STARTED_BOOKS_SQL)
     return _group_books_by_categories(books)
 
 
 async def get_already_read_books() -> Iterable[Book]:
-    sql = f"""{_get_books_base_sql()}
-              WHERE read_start<current_date
-                  AND read_finish  <= current_date
-              ORDER BY b.read_start"""
-    return await _get_books_from_db(sql)
+    return await _get_books_from_db(_ALREADY_READ_BOOKS_SQL)
 
 
 async def get_now_reading_books() -> Iterable[Book]:
-    sql = f"""{_get_books_base_sql()}
-              WHERE read_start<=current_date
-                  AND read_finish>=current_date
-              ORDER BY b.read_start"""
-    return await _get_books_from_db(sql)
+    return await _get_books_from_db(_NOW_READING_BOOKS_SQL)
 
 
 async def get_next_book() -> Book | None:
-    sql = f"""{_get_books_base_sql()}
-              WHERE b.read_start > current_date
-              ORDER BY b.read_start
-              LIMIT 1"""
-    books = await _get_books_from_db(sql)
+    books = await _get_books_from_db(_NEXT_BOOK_SQL)
     if not books:
         return None
     return books[0]
@@ -108,7 +91,7 @@ def calculate_category_books_start_index(
     start_index = 0
     for category in categories:
         if category.id != current_category.id:
-            start_index += len(tuple(category.books))
+            start_index += len(category.books)
         else:
             break
 
@@ -118,11 +101,9 @@ def calculate_category_books_start_index(
 async def get_books_by_positional_numbers(numbers: Iterable[int]) -> tuple[Book]:
     numbers_joined = ", ".join(map(str, map(int, numbers)))
 
-    hardcoded_sql_values = []
-    for index, number in enumerate(numbers, 1):
-        hardcoded_sql_values.append(f"({number}, {index})")
-
-    output_hardcoded_sql_values = ", ".join(hardcoded_sql_values)
+    output_hardcoded_sql_values = ", ".join(
+        f"({number}, {index})" for index, number in enumerate(numbers, 1)
+    )
 
     base_sql = _get_books_base_sql(
         'ROW_NUMBER() over (order by c."ordering", b."ordering") as idx'
@@ -146,9 +127,9 @@ async def get_books_by_positional_numbers(numbers: Iterable[int]) -> tuple[Book]
 
 
 async def get_book_names_by_ids(ids: Iterable[int]) -> dict[int, str]:
-    int_ids = tuple(map(str, map(int, ids)))
+    int_ids_joined = ",".join(str(int(id_)) for id_ in ids)
     sql = f"""{_get_books_base_sql()}
-              WHERE b.id IN ({",".join(int_ids)})
+              WHERE b.id IN ({int_ids_joined})
               ORDER BY c."name", b."name" """
     books = await _get_books_from_db(cast(LiteralString, sql))
     return {book.id: book.name for book in books}
@@ -191,6 +172,31 @@ def _get_books_base_sql(select_param: LiteralString | None = None) -> LiteralStr
     """
 
 
+# Hot SELECTs are built once at import so SQLite's statement cache
+# gets the same text on every call.
+_ALL_BOOKS_SQL: LiteralString = f"""{_get_books_base_sql()}
+    ORDER BY c."ordering", b."ordering" """
+
+_NOT_STARTED_BOOKS_SQL: LiteralString = f"""{_get_books_base_sql()}
+    WHERE b.read_start IS NULL
+    ORDER BY c."ordering", b."ordering" """
+
+_ALREADY_READ_BOOKS_SQL: LiteralString = f"""{_get_books_base_sql()}
+    WHERE read_start<current_date
+        AND read_finish  <= current_date
+    ORDER BY b.read_start"""
+
+_NOW_READING_BOOKS_SQL: LiteralString = f"""{_get_books_base_sql()}
+    WHERE read_start<=current_date
+        AND read_finish>=current_date
+    ORDER BY b.read_start"""
+
+_NEXT_BOOK_SQL: LiteralString = f"""{_get_books_base_sql()}
+    WHERE b.read_start > current_date
+    ORDER BY b.read_start
+    LIMIT 1"""
+
+
 async def _get_books_from_db(sql: LiteralString) -> list[Book]:
     books_raw = await fetch_all(sql)
     return [
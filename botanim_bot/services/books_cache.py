@@ -0,0 +1,82 @@
+import time
+
+from botanim_bot import config
+from botanim_bot.services.books import (
+    Category,
+    calculate_category_books_start_index,
+    get_all_books,
+    get_not_started_books,
+)
+from botanim_bot.templates import render_template
+
+
+CACHE_TTL_SECONDS = 60
+
+_categories_cache: dict[str, tuple[float, tuple[Category, ...]]] = {}
+_rendered_pages_cache: dict[str, tuple[float, tuple[str, ...]]] = {}
+
+
+async def get_categories_by_callback_prefix(
+    callback_prefix: str,
+) -> tuple[Category, ...]:
+    """Returns categories with books for paginator `callback_prefix`.
+
+    Result is cached for `CACHE_TTL_SECONDS` so that paginator
+    clicks don't hit the database on every `<`/`>` press."""
+    return (await _get_categories_cache_entry(callback_prefix))[1]
+
+
+async def get_category_pages_by_callback_prefix(
+    callback_prefix: str,
+) -> tuple[str, ...]:
+    """Returns the rendered category page texts for `callback_prefix`.
+
+    Pages are prerendered once per TTL window, so a paginator click
+    reduces to a tuple index instead of a template render. The vote
+    paginator numbers its books, hence the start index; /allbooks
+    doesn't."""
+    cache_entry = _rendered_pages_cache.get(callback_prefix)
+    if cache_entry and time.monotonic() - cache_entry[0] < CACHE_TTL_SECONDS:
+        return cache_entry[1]
+
+    fetched_at, categories = await _get_categories_cache_entry(callback_prefix)
+    with_start_index = callback_prefix == config.VOTE_BOOKS_CALLBACK_PATTERN
+    pages = tuple(
+        render_template(
+            "category_with_books.j2",
+            {
+                "category": category,
+                "start_index": (
+                    calculate_category_books_start_index(categories, category)
+                    if with_start_index
+                    else None
+                ),
+            },
+        )
+        for category in categories
+    )
+    # Stamp pages with the fetch time of the underlying categories, so
+    # both caches expire together and staleness never exceeds one TTL.
+    _rendered_pages_cache[callback_prefix] = (fetched_at, pages)
+    return pages
+
+
+async def _get_categories_cache_entry(
+    callback_prefix: str,
+) -> tuple[float, tuple[Category, ...]]:
+    cache_entry = _categories_cache.get(callback_prefix)
+    if cache_entry and time.monotonic() - cache_entry[0] < CACHE_TTL_SECONDS:
+        return cache_entry
+
+    if callback_prefix == config.ALL_BOOKS_CALLBACK_PATTERN:
+        categories = tuple(await get_all_books())
+    else:
+        categories = tuple(await get_not_started_books())
+    cache_entry = (time.monotonic(), categories)
+    _categories_cache[callback_prefix] = cache_entry
+    return cache_entry
+
+
+def clear_categories_cache() -> None:
+    _categories_cache.clear()
+    _rendered_pages_cache.clear()
@@ -1,5 +1,11 @@
+from functools import lru_cache
+
+
+_BOOK_WORDS = ("книга", "книги", "книг")
+
+
+@lru_cache(maxsize=256)
 def books_to_words(books_count: int) -> str:
-    days = ["книга", "книги", "книг"]
     if books_count % 10 == 1 and books_count % 100 != 11:
         p = 0
     elif 2 <= books_count % 10 <= 4 and (
@@ -8,4 +14,4 @@ def books_to_words(books_count: int) -> str:
         p = 1
     else:
         p = 2
-    return days[p]
+    return _BOOK_WORDS[p]
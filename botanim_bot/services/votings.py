@@ -1,12 +1,14 @@
 from dataclasses import dataclass
 from datetime import datetime
 import logging
+import time
 from typing import Iterable
 
 from botanim_bot.services.books import Book, format_book_name
+from botanim_bot.services.books_cache import clear_categories_cache
 from botanim_bot.services.users import insert_user
 from botanim_bot import config
-from botanim_bot.db import execute, fetch_one
+from botanim_bot.db import execute, fetch_one, transaction
 from botanim_bot.services.exceptions import UserInNotVoteMode, NoActualVoting
 from botanim_bot.services.vote_mode import (
     is_user_in_vote_mode,
@@ -17,6 +19,11 @@ from botanim_bot.services.vote_mode import (
 logger = logging.getLogger(__name__)
 
 
+ACTUAL_VOTING_CACHE_TTL_SECONDS = 30
+
+_actual_voting_cache: tuple[float, "Voting | None"] | None = None
+
+
 @dataclass
 class Voting:
     id: int
@@ -52,19 +59,21 @@ class Vote:
 
 
 async def get_actual_voting() -> Voting | None:
-    sql = """
-        SELECT id, voting_start, voting_finish
-        FROM voting
-        WHERE voting_start <= current_date
-            AND voting_finish >= current_date
-        ORDER BY voting_start
-        LIMIT 1
-    """
-    voting = await fetch_one(sql)
-    if not voting:
-        return None
+    """Returns the active voting, cached for a short TTL.
 
-    return _build_voting(voting)
+    Voting windows change on the order of days, so bursts of /vote
+    commands and vote messages don't need to re-query the database."""
+    global _actual_voting_cache
+    if (
+        _actual_voting_cache
+        and time.monotonic() - _actual_voting_cache[0]
+        < ACTUAL_VOTING_CACHE_TTL_SECONDS
+    ):
+        return _actual_voting_cache[1]
+
+    voting = await _fetch_actual_voting()
+    _actual_voting_cache = (time.monotonic(), voting)
+    return voting
 
 
 async def get_actual_or_last_voting() -> Voting | None:
@@ -85,20 +94,20 @@ async def save_vote(telegram_user_id: int, books: Iterable[Book]) -> None:
         VALUES (:vote_id, :user_id, :first_book, :second_book, :third_book)
         """
     books = tuple(books)
-    await execute("begin")
-    await execute(
-        sql,
-        {
-            "vote_id": actual_voting.id,
-            "user_id": telegram_user_id,
-            "first_book": books[0].id,
-            "second_book": books[1].id,
-            "third_book": books[2].id,
-        },
-        autocommit=False,
-    )
-    await remove_user_from_vote_mode(telegram_user_id)
-    await execute("commit")
+    async with transaction():
+        await execute(
+            sql,
+            {
+                "vote_id": actual_voting.id,
+                "user_id": telegram_user_id,
+                "first_book": books[0].id,
+                "second_book": books[1].id,
+                "third_book": books[2].id,
+            },
+            autocommit=False,
+        )
+        await remove_user_from_vote_mode(telegram_user_id)
+    clear_categories_cache()
 
 
 async def get_user_vote(user_id: int, voting_id: int) -> Vote | None:
@@ -125,6 +134,22 @@ async def get_user_vote(user_id: int, voting_id: int) -> Vote | None:
     )
 
 
+async def _fetch_actual_voting() -> Voting | None:
+    sql = """
+        SELECT id, voting_start, voting_finish
+        FROM voting
+        WHERE voting_start <= current_date
+            AND voting_finish >= current_date
+        ORDER BY voting_start
+        LIMIT 1
+    """
+    voting = await fetch_one(sql)
+    if not voting:
+        return None
+
+    return _build_voting(voting)
+
+
 def _build_voting(voting_db_row: dict) -> Voting:
     return Voting(
         id=voting_db_row["id"],
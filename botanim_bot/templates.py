@@ -1,17 +1,32 @@
 import re
+from functools import lru_cache
 
 import jinja2
 
 from botanim_bot import config
 
 
+_MULTISPACE_RE = re.compile(" +")
+
+
 def render_template(template_name: str, data: dict | None = None) -> str:
-    if data is None:
-        data = {}
+    if not data:
+        return _render_static_template(template_name)
+    return _render(template_name, data)
+
+
+@lru_cache(maxsize=None)
+def _render_static_template(template_name: str) -> str:
+    """Templates rendered without data always produce the same text,
+    so render them once and reuse the result."""
+    return _render(template_name, {})
+
+
+def _render(template_name: str, data: dict) -> str:
     template = _get_template_env().get_template(template_name)
     rendered = template.render(**data).replace("\n", " ")
     rendered = rendered.replace("<br>", "\n")
-    rendered = re.sub(" +", " ", rendered).replace(" .", ".").replace(" ,", ",")
+    rendered = _MULTISPACE_RE.sub(" ", rendered).replace(" .", ".").replace(" ,", ",")
     rendered = "\n".join(line.strip() for line in rendered.split("\n"))
     rendered = rendered.replace("{FOURPACES}", "    ")
     return rendered